@@ -11,23 +11,50 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import csv
+import functools
+import gzip
+import hashlib
+import io
 import json
 import math
+import operator
 import re
+import sqlite3
+import threading
 import time
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
+import ijson
 import pandas as pd
 import requests
 import tldextract
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
 from dotenv import load_dotenv
 import os
 import sys
 
+try:
+    import ahocorasick  # pyahocorasick: linear-time multi-keyword scan
+except ImportError:  # fall back to a single regex alternation
+    ahocorasick = None
+
+try:
+    from lxml import etree as lxml_etree, html as lxml_html  # C HTML parser for visible text
+except ImportError:  # fall back to BeautifulSoup's pure-Python parser
+    lxml_etree = lxml_html = None
+
+try:
+    import orjson  # fast JSON decoding of API responses and encoding of --resume rows
+except ImportError:  # fall back to the stdlib decoder used by requests
+    orjson = None
+
 # ---------------- Defaults (can be overridden by CLI) ----------------
 DEFAULT_OUTFILE = "esn_candidates.csv"
 DEFAULT_PER_PAGE = 100
@@ -38,9 +65,27 @@ DEFAULT_NAF_CODES = ["62.02A", "71.12B"]
 DEFAULT_MIN_EMP = 10
 DEFAULT_MAX_EMP = 500
 DEFAULT_EXCLUDE_OVER_EMP = 2000  # hard exclusion threshold on very large companies
+DEFAULT_WORKERS = 8  # candidates processed concurrently
+DEFAULT_API_CACHE = "esn_api_cache.sqlite"  # used with --cache
+API_CACHE_TTL = 86400  # seconds
+DEFAULT_HTML_CACHE_DIR = "html_cache"  # used with --http-cache
+HTML_CACHE_MISS_TTL = 86400  # seconds a failed page fetch is remembered by --http-cache
+DEFAULT_HOMEPAGE_CACHE = "homepage_cache.sqlite"  # used with --homepage-cache
+DEFAULT_RESUME_DB = "esn_cache.sqlite"  # used with --resume
+RESUME_COMMIT_EVERY = 50  # processed rows between two commits of the resume database
+# Max number of pages fetched concurrently (homepage guesses, NAF prefixes)
+FETCH_CONCURRENCY = 32
+# Concurrent SIREN enrichment calls (entreprise.data.gouv.fr)
+ENRICH_WORKERS = 16
+# Minimum spacing between two requests to the same website / search API (seconds)
+WEB_MIN_INTERVAL = 0.2
+SEARCH_MIN_INTERVAL = 0.2
+# Connections kept alive per host by the shared session (>= FETCH_CONCURRENCY + DEFAULT_WORKERS)
+HTTP_POOL_SIZE = 64
 
 # Target NAF prefixes for pertinence scoring (refined)
 NAF_CODES_TARGET = ["71.12", "62.02", "70.22", "78"]
+NAF_CODES_TARGET_T = tuple(NAF_CODES_TARGET)  # str.startswith accepts a tuple of prefixes
 
 # Keywords (French)
 NAME_KEYWORDS = [
@@ -54,6 +99,11 @@ SITE_KEYWORDS = [
     "commercial sédentaire", "placement", "staffing", "consulting", "bureau d'études",
     "solutions engineering", "staff augmentation", "assistance technique"
 ]
+# Crude job posting check on the scanned pages
+JOB_KEYWORDS = [
+    "offre", "recrutement", "carriere", "carrières", "careers", "job",
+    "poste", "recrute", "candidat", "join us"
+]
 
 SCORE_RULES = {
     "naf": 3,
@@ -63,17 +113,109 @@ SCORE_RULES = {
     "size": 2,
 }
 
-# Candidate site paths to probe lightly
-CANDIDATE_PATHS = [
-    "/services", "/service", "/recrutement", "/carriere", "/carrieres", "/careers",
+# Candidate site paths to probe lightly, by the signal they are most likely to reveal.
+# All start with '/' so they are appended to the site root without urljoin.
+SERVICE_PATHS = ["/services", "/service"]
+JOB_PATHS = [
+    "/recrutement", "/carriere", "/carrieres", "/careers",
     "/jobs", "/offres", "/offres-demploi", "/offre", "/join-us"
 ]
+CANDIDATE_PATHS = SERVICE_PATHS + JOB_PATHS
+MAX_PAGES_PER_SITE = 5  # homepage included, cap to be polite
+MAX_PAGE_TEXT = 200_000  # visible characters kept per page for keyword matching
+# Elements whose content is never displayed
+INVISIBLE_TAGS = ("script", "style", "noscript", "svg")
+
+# Precompiled regular expressions (used for every candidate / keyword)
+_NAF_FULL_RE = re.compile(r"^\d{2}\.\d{2}[A-Z]$", re.IGNORECASE)  # full code like 62.02A
+_WS_RE = re.compile(r"\s+")
+_NONALNUM_RE = re.compile(r"[^a-z0-9\- ]")
+_DIGITS_RE = re.compile(r"\d+")
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+# French legal forms, ignored when comparing company names
+_LEGAL_FORM_RE = re.compile(r"\b(?:sa|sas|sasu|sarl|eurl|sca|sci|snc|scop|selarl)\b")
+
+# Social/aggregator hosts never taken as a company homepage from search results
+# (tuples so that a single str.endswith call checks them all)
+SERP_BAD_HOST_SUFFIXES = (
+    "linkedin.com", "fr.linkedin.com", "facebook.com", "twitter.com", "x.com",
+    "societe.com", "societeinfo.com", "verif.com", "manageo.fr", "bloomberg.com",
+    "wikipedia.org", "indeed.fr", "welcometothejungle.com",
+)
+# SerpAPI returns more press results; skip the main newspapers as well
+SERPAPI_BAD_HOST_SUFFIXES = SERP_BAD_HOST_SUFFIXES + ("lefigaro.fr", "lemonde.fr")
+
+# JSON APIs whose transient 429/503 answers are retried (with backoff) by urllib3.
+# serper.dev is left out on purpose: a 429 there means quota exhausted and triggers key rotation.
+API_RETRY_PREFIXES = (
+    "https://recherche-entreprises.api.gouv.fr/",
+    "https://entreprise.data.gouv.fr/",
+    "https://api.insee.fr/",
+    "https://serpapi.com/",
+)
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter taking the host's RATE_LIMITER slot before each request it actually sends.
+    A CachedSession answers hits before reaching the adapter, so they skip the wait.
+    """
 
-# Shared HTTP session
-SESSION = requests.Session()
-SESSION.headers.update({
-    "User-Agent": "ESN-Discovery/1.0 (+https://example.com)"
-})
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        RATE_LIMITER.acquire(request.url or "")
+        return super().send(request, **kwargs)
+
+
+def build_session(cache_path: Optional[str] = None, pool_size: int = HTTP_POOL_SIZE) -> requests.Session:
+    """Create the shared HTTP session.
+    With cache_path, deterministic API answers (SIRENE, Recherche, INSEE data, SerpAPI, serper.dev)
+    are persisted in a sqlite file so later runs skip the network; websites and tokens are never cached.
+    pool_size is the number of keep-alive connections kept per host; it should cover every thread
+    that may hit the same host at once, otherwise urllib3 discards the extra connections.
+    """
+    # Larger keep-alive pools: concurrent fetches to the same host reuse connections instead of
+    # re-doing TCP/TLS handshakes. Websites get no retries (dead guessed domains are common).
+    web_adapter = RateLimitedAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    api_adapter = RateLimitedAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 503], raise_on_status=False),
+    )
+    if cache_path:
+        from requests_cache import DO_NOT_CACHE, CachedSession
+
+        cached_urls = [
+            "recherche-entreprises.api.gouv.fr",
+            "entreprise.data.gouv.fr",
+            INSEE_SIRENE_BASE.split("://", 1)[-1],
+            "serpapi.com",
+            "google.serper.dev",
+        ]
+        urls_expire_after: Dict[str, Any] = {u: API_CACHE_TTL for u in cached_urls}
+        urls_expire_after["*"] = DO_NOT_CACHE
+        session: requests.Session = CachedSession(
+            cache_path,
+            backend="sqlite",
+            allowable_methods=("GET", "POST"),  # serper.dev queries are POSTs
+            urls_expire_after=urls_expire_after,
+            stale_if_error=True,
+        )
+    else:
+        session = requests.Session()
+    session.headers.update({
+        "User-Agent": "ESN-Discovery/1.0 (+https://example.com)",
+        "Accept-Encoding": "gzip, deflate",
+        # Explicit even though it is the HTTP/1.1 default: some old servers close otherwise
+        "Connection": "keep-alive",
+    })
+    session.mount("http://", web_adapter)
+    session.mount("https://", web_adapter)
+    for prefix in API_RETRY_PREFIXES:
+        session.mount(prefix, api_adapter)
+    return session
+
+
+# Shared pool for concurrent page fetches; the work is I/O-bound so threads overlap network waits
+_FETCH_POOL = ThreadPoolExecutor(max_workers=FETCH_CONCURRENCY, thread_name_prefix="fetch")
 
 # Load environment variables (for INSEE OAuth)
 load_dotenv()
@@ -97,25 +239,101 @@ if not SERPER_API_KEYS:
     if single_key:
         SERPER_API_KEYS.append(single_key)
 
-# Track current Serper key index and usage
+# Track current Serper key index and usage (shared by worker threads, guarded by the lock)
 CURRENT_SERPER_KEY_INDEX = 0
 SERPER_KEY_USAGE = {i: 0 for i in range(len(SERPER_API_KEYS))}
+_SERPER_KEY_LOCK = threading.Lock()
+
+# Serializes console output from worker threads so lines do not interleave
+_PRINT_LOCK = threading.Lock()
+
+# Shared HTTP session (replaced by a cached one in main() when --cache is given)
+SESSION = build_session()
 
 
 # ---------------- Utilities ----------------
 
-def call_api(url: str, params: Optional[dict] = None, max_tries: int = 3, sleep: float = DEFAULT_SLEEP) -> Optional[dict]:
-    for i in range(max_tries):
-        try:
-            r = SESSION.get(url, params=params, timeout=20)
-            if r.status_code == 200:
-                return r.json()
-            if r.status_code in (429, 503):
-                time.sleep(2 + i * 2)
-                continue
-            return None
-        except Exception:
-            time.sleep(1 + i)
+def log(*args: Any) -> None:
+    """print() that is safe to call from several threads."""
+    with _PRINT_LOCK:
+        print(*args)
+
+
+class TokenBucket:
+    """Spaces calls to one host at least `interval` seconds apart, across all threads."""
+
+    def __init__(self, interval: float):
+        self.interval = max(0.0, interval)
+        self.next_time = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        # Reserve the next slot under the lock, then sleep outside it
+        with self._lock:
+            now = time.monotonic()
+            wait = self.next_time - now
+            self.next_time = max(now, self.next_time) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+class HostRateLimiter:
+    """One TokenBucket per host (netloc): waiting on one API never delays calls to another.
+    Callers declare a host's spacing with set_interval(); the session's adapters call acquire()
+    right before a request goes out, so responses replayed by --cache are never throttled.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def set_interval(self, url: str, interval: float) -> None:
+        """Space the requests to url's host `interval` seconds apart (the first declaration wins)."""
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(interval)
+
+    def acquire(self, url: str) -> None:
+        """Wait for the next slot of url's host (hosts never declared are not throttled)."""
+        with self._lock:
+            bucket = self._buckets.get(urlparse(url).netloc)
+        if bucket is not None:
+            bucket.acquire()
+
+
+RATE_LIMITER = HostRateLimiter()
+
+
+def response_json(resp: requests.Response) -> Any:
+    """Decode a JSON response body, with orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+def json_dumps(obj: Any) -> str:
+    """Serialize to compact JSON text (non-ASCII kept as is), with orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+def json_loads(data: str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def call_api(url: str, params: Optional[dict] = None, sleep: float = DEFAULT_SLEEP) -> Optional[dict]:
+    """GET a JSON API, spacing calls to the same host by `sleep` seconds.
+    Retries with backoff on 429/503 and connection errors are done by the session's Retry policy.
+    """
+    RATE_LIMITER.set_interval(url, sleep)
+    try:
+        r = SESSION.get(url, params=params, timeout=20)
+        if r.status_code == 200:
+            return response_json(r)
+    except Exception:
+        return None
     return None
 
 def naf_search_terms(code: str) -> List[str]:
@@ -127,7 +345,7 @@ def naf_search_terms(code: str) -> List[str]:
     c = str(code).strip()
     terms: List[str] = []
     # full code pattern like NN.NNX (with trailing letter)
-    if re.match(r"^\d{2}\.\d{2}[A-Z]$", c, re.IGNORECASE):
+    if _NAF_FULL_RE.match(c):
         terms.append(c)
         terms.append(c + "*")
     else:
@@ -138,6 +356,13 @@ def naf_search_terms(code: str) -> List[str]:
             terms.append(c + "*")
     return terms
 
+@functools.lru_cache(maxsize=1024)
+def tranche_numbers(tranche: str) -> Tuple[int, ...]:
+    """Return the integers mentioned in a tranche string.
+    Only a handful of distinct tranche values exist, so each is parsed once.
+    """
+    return tuple(int(n) for n in _DIGITS_RE.findall(tranche))
+
 def indicates_zero_employees(tranche: Optional[str]) -> bool:
     """Return True if the tranche/effectif string clearly indicates 0 employees.
     Handles INSEE code '00' and textual variants like '0', '0-0', '0 salarié'.
@@ -156,7 +381,7 @@ def indicates_zero_employees(tranche: Optional[str]) -> bool:
     if "0 salari" in low:  # salarié / salaries
         return True
     # If all numeric mentions are 0, treat as zero employees
-    nums = [int(n) for n in re.findall(r"\d+", low)]
+    nums = tranche_numbers(low)
     return bool(nums) and max(nums) == 0
 
 # Approximate SIRENE tranche codes to upper bounds
@@ -186,7 +411,7 @@ def tranche_above_threshold(tranche: Optional[str], threshold: int) -> bool:
     if code in TRANCHE_CODE_UPPER:
         return TRANCHE_CODE_UPPER[code] > threshold
     # Fallback: parse any numbers
-    nums = [int(n) for n in re.findall(r"\d+", code)]
+    nums = tranche_numbers(code)
     return bool(nums) and max(nums) > threshold
 
 def allowed_tranche_codes(max_emp: int) -> List[str]:
@@ -200,6 +425,12 @@ def allowed_tranche_codes(max_emp: int) -> List[str]:
     allowed_sorted.append('NN')
     return allowed_sorted
 
+def insee_tranche_clause(max_emp: Optional[int]) -> str:
+    """Return an INSEE `q` clause keeping only tranche codes <= max_emp ('' when disabled)."""
+    if max_emp is None or max_emp < 0:
+        return ""
+    return " AND trancheEffectifsUniteLegale:(" + " OR ".join(allowed_tranche_codes(max_emp)) + ")"
+
 def fetch_establishments_by_naf_prefix_recherche(
     naf_code: str,
     per_page: int,
@@ -259,27 +490,26 @@ def fetch_establishments_by_naf_prefix_recherche(
         total = j.get("total_results")
         if total and page * page_size >= int(total):
             break
-        time.sleep(sleep)
     return results
 
+# Minimal accent folding table, applied in a single str.translate pass
+_ACCENT_FOLD = str.maketrans({
+    "é": "e", "è": "e", "ê": "e", "ë": "e",
+    "à": "a", "â": "a",
+    "î": "i", "ï": "i",
+    "ô": "o", "ö": "o",
+    "ù": "u", "û": "u",
+})
+
 def normalize_string(s: Optional[str]) -> str:
     if not s:
         return ""
-    s = s.strip().lower()
-    # minimal accent folding
-    s = (
-        s.replace("é", "e").replace("è", "e").replace("ê", "e").replace("ë", "e")
-         .replace("à", "a").replace("â", "a")
-         .replace("î", "i").replace("ï", "i")
-         .replace("ô", "o").replace("ö", "o")
-         .replace("ù", "u").replace("û", "u")
-    )
-    s = re.sub(r"\s+", " ", s)
-    return s
+    s = s.strip().lower().translate(_ACCENT_FOLD)
+    return _WS_RE.sub(" ", s)
 
 def guess_domain_from_name(name: str) -> List[str]:
     base = normalize_string(name)
-    base = re.sub(r"[^a-z0-9\- ]", "", base)
+    base = _NONALNUM_RE.sub("", base)
     parts = [p for p in base.split() if len(p) > 1]
     if not parts:
         return []
@@ -292,14 +522,9 @@ def guess_domain_from_name(name: str) -> List[str]:
         "-".join(parts) + ".com",
     ]
     # unique while preserving order
-    seen = set()
-    uniq: List[str] = []
-    for c in candidates:
-        if c not in seen:
-            seen.add(c)
-            uniq.append(c)
-    return uniq
+    return list(dict.fromkeys(candidates))
 
+@functools.lru_cache(maxsize=8192)
 def extract_domain_from_url(url: str) -> Optional[str]:
     try:
         return urlparse(url).netloc
@@ -311,23 +536,169 @@ def ensure_http(url: str) -> str:
         return "http://" + url
     return url
 
+# Directory of gzip-compressed page bodies, enabled by --http-cache (None = disabled)
+HTML_CACHE_DIR: Optional[Path] = None
+
+def html_cache_file(url: str) -> Optional[Path]:
+    if HTML_CACHE_DIR is None:
+        return None
+    return HTML_CACHE_DIR / (hashlib.sha1(url.encode("utf-8")).hexdigest() + ".html.gz")
+
+# Failed fetches (dead host, missing page, non-HTML answer) leave an empty "<sha1>.html.miss"
+# marker next to the cached bodies; its mtime says when the URL was last tried.
+def html_cache_recent_miss(cache_file: Optional[Path]) -> bool:
+    if cache_file is None:
+        return False
+    try:
+        return time.time() - cache_file.with_suffix(".miss").stat().st_mtime < HTML_CACHE_MISS_TTL
+    except OSError:
+        return False
+
+def html_cache_record_miss(cache_file: Optional[Path]) -> None:
+    if cache_file is not None:
+        cache_file.with_suffix(".miss").touch()
+
 def http_get_html(url: str, timeout: int = 15) -> Optional[str]:
+    cache_file = html_cache_file(url)
+    if cache_file is not None and cache_file.exists():
+        return gzip.decompress(cache_file.read_bytes()).decode("utf-8", "replace")
+    if html_cache_recent_miss(cache_file):
+        return None
+    RATE_LIMITER.set_interval(url, WEB_MIN_INTERVAL)
     try:
         r = SESSION.get(url, timeout=timeout, allow_redirects=True)
         if r.status_code == 200 and "text/html" in r.headers.get("Content-Type", ""):
-            return r.text
+            html = r.text
+            if cache_file is not None:
+                # Write to a per-thread temp file then rename, so readers never see a partial body
+                tmp = cache_file.with_name(f"{cache_file.name}.{threading.get_ident()}.tmp")
+                tmp.write_bytes(gzip.compress(html.encode("utf-8")))
+                os.replace(tmp, cache_file)
+            return html
     except Exception:
-        return None
+        pass
+    html_cache_record_miss(cache_file)
     return None
 
-def find_keywords_in_text(text: str, keyword_list: List[str]) -> List[str]:
-    text_norm = normalize_string(text)
-    found = []
-    for k in keyword_list:
-        if normalize_string(k) in text_norm:
-            found.append(k)
-    return found
+# Hosts that rejected HEAD (405/501); their pages are probed with GET directly
+_HEAD_UNSUPPORTED_HOSTS: Set[str] = set()
 
+def http_probe_html(url: str, timeout: int = 8) -> Optional[str]:
+    """GET a candidate page only if a HEAD request says it exists and is HTML.
+    Missing pages (the common case) then cost a header exchange instead of a full download.
+    """
+    cache_file = html_cache_file(url)
+    if cache_file is not None and cache_file.exists():
+        return http_get_html(url)
+    if html_cache_recent_miss(cache_file):
+        return None
+    host = extract_domain_from_url(url)
+    if host not in _HEAD_UNSUPPORTED_HOSTS:
+        RATE_LIMITER.set_interval(url, WEB_MIN_INTERVAL)
+        try:
+            r = SESSION.head(url, timeout=timeout, allow_redirects=True)
+        except Exception:
+            html_cache_record_miss(cache_file)
+            return None
+        if r.status_code in (405, 501):
+            _HEAD_UNSUPPORTED_HOSTS.add(host)
+        elif r.status_code != 200 or "text/html" not in r.headers.get("Content-Type", ""):
+            html_cache_record_miss(cache_file)
+            return None
+    return http_get_html(url)
+
+def html_to_text(html: str) -> str:
+    """Return the visible text of a page (scripts, styles and inline SVG removed), capped at MAX_PAGE_TEXT."""
+    if lxml_html is not None:
+        try:
+            doc = lxml_html.fromstring(html)
+        except (ValueError, lxml_etree.ParserError):  # empty page, encoding declaration in a str
+            doc = None
+        if doc is not None:
+            for el in list(doc.iter(*INVISIBLE_TAGS)):
+                if el.getparent() is not None:
+                    el.drop_tree()
+            return " ".join(t.strip() for t in doc.itertext() if t.strip())[:MAX_PAGE_TEXT]
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup(list(INVISIBLE_TAGS)):
+        tag.decompose()
+    return soup.get_text(" ", strip=True)[:MAX_PAGE_TEXT]
+
+def http_get_many(urls: List[str], fetch: Callable[[str], Optional[str]] = http_get_html) -> List[Optional[str]]:
+    """Fetch several pages concurrently through the shared session.
+    Results are returned in the same order as `urls` (None on failure).
+    """
+    if len(urls) <= 1:
+        return [fetch(u) for u in urls]
+    return list(_FETCH_POOL.map(fetch, urls))
+
+@functools.lru_cache(maxsize=None)
+def _keyword_matcher(keywords: Tuple[str, ...]) -> Tuple[Callable[[str], Set[str]], Tuple[Tuple[str, str], ...]]:
+    """Build, once per keyword list, a scanner returning the normalized keywords found in a normalized text.
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, else one regex alternation.
+    Both report overlapping keywords (e.g. "consultant" / "consultants") in a single pass.
+    """
+    pairs = tuple((k, normalize_string(k)) for k in keywords)
+    alternatives = sorted({kn for _, kn in pairs if kn}, key=len, reverse=True)
+    if not alternatives:
+        return (lambda text_norm: set()), pairs
+
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for kn in alternatives:
+            automaton.add_word(kn, kn)
+        automaton.make_automaton()
+
+        def scan(text_norm: str) -> Set[str]:
+            return {kn for _, kn in automaton.iter(text_norm)}
+    else:
+        # Longest first inside a lookahead: a match is attempted at every position
+        pattern = re.compile("(?=(" + "|".join(re.escape(kn) for kn in alternatives) + "))")
+
+        def scan(text_norm: str) -> Set[str]:
+            hits = {m.group(1) for m in pattern.finditer(text_norm)}
+            # A keyword is present iff it is a substring of one of the (longest-first) hits
+            return {kn for kn in alternatives if any(kn in h for h in hits)}
+
+    return scan, pairs
+
+def match_keywords(text_norm: str, keyword_list: List[str]) -> List[str]:
+    """Return the keywords (original spelling, list order) contained in an already normalized text."""
+    scan, pairs = _keyword_matcher(tuple(keyword_list))
+    found = scan(text_norm) if text_norm else set()
+    return [k for k, kn in pairs if kn in found]
+
+# Site and job keywords are looked for in the same pages: one scanner covers both lists
+PAGE_KEYWORDS = tuple(dict.fromkeys(SITE_KEYWORDS + JOB_KEYWORDS))
+_SITE_KEYWORD_PAIRS = tuple((k, normalize_string(k)) for k in SITE_KEYWORDS)
+_JOB_KEYWORDS_NORM = frozenset(normalize_string(k) for k in JOB_KEYWORDS)
+
+def analyze_text(text_norm: str) -> Tuple[List[str], bool]:
+    """Return the site keywords found in a normalized page text and whether it mentions job postings.
+    The text is scanned a single time for both keyword families.
+    """
+    if not text_norm:
+        return [], False
+    scan, _ = _keyword_matcher(PAGE_KEYWORDS)
+    found = scan(text_norm)
+    return [k for k, kn in _SITE_KEYWORD_PAIRS if kn in found], not found.isdisjoint(_JOB_KEYWORDS_NORM)
+
+
+# A search hit scoring at least this much (TLD + name overlap) is trusted without heuristic guesses
+SERP_CONFIDENT_SCORE = 3
+
+def serp_query_tokens(query: str) -> Set[str]:
+    return {t for t in _TOKEN_RE.findall(normalize_string(query)) if len(t) > 2}
+
+def score_serp_host(host: str, qtokens: Set[str]) -> int:
+    """Score a result host by TLD (.fr) and overlap between its tokens and the query tokens."""
+    host_l = host.lower()
+    score = 0
+    if host_l.endswith(".fr"):
+        score += 2
+    tokens = set(_TOKEN_RE.findall(host_l))
+    score += min(len(qtokens & tokens), 3)
+    return score
 
 def serpapi_find_domain(
     query: str,
@@ -339,8 +710,9 @@ def serpapi_find_domain(
 ) -> Optional[str]:
     """
     Query SerpAPI for the company and try to infer the official domain from organic results.
-    Preference: .fr domains and domains whose tokens match the company name; skip social/aggregator sites.
+    Preference: .fr domains and domains whose tokens match the query; skip social/aggregator sites.
     """
+    RATE_LIMITER.set_interval("https://serpapi.com/search.json", SEARCH_MIN_INTERVAL)
     try:
         resp = SESSION.get(
             "https://serpapi.com/search.json",
@@ -356,17 +728,11 @@ def serpapi_find_domain(
         )
         if resp.status_code != 200:
             return None
-        data = resp.json() or {}
+        data = response_json(resp) or {}
         results = data.get("organic_results") or []
         if not isinstance(results, list):
             return None
-        bad_hosts = {
-            "linkedin.com", "fr.linkedin.com", "facebook.com", "twitter.com", "x.com",
-            "societe.com", "societeinfo.com", "verif.com", "manageo.fr", "bloomberg.com",
-            "wikipedia.org", "lefigaro.fr", "lemonde.fr", "indeed.fr", "welcometothejungle.com"
-        }
-        qnorm = normalize_string(query)
-        qtokens = {t for t in re.findall(r"[a-z0-9]+", qnorm) if len(t) > 2}
+        qtokens = serp_query_tokens(query)
         candidates: List[Tuple[int, str]] = []
         for r in results:
             link = r.get("link") or r.get("url")
@@ -376,17 +742,9 @@ def serpapi_find_domain(
             if not host:
                 continue
             host_l = host.lower()
-            if any(host_l.endswith(bad) or host_l == bad for bad in bad_hosts):
+            if host_l.endswith(SERPAPI_BAD_HOST_SUFFIXES):
                 continue
-            # score the host by TLD and name overlap
-            score = 0
-            if host_l.endswith(".fr"):
-                score += 2
-            # tokens overlap
-            tokens = set(re.findall(r"[a-z0-9]+", host_l))
-            overlap = len(qtokens & tokens)
-            score += min(overlap, 3)
-            candidates.append((score, host))
+            candidates.append((score_serp_host(host_l, qtokens), host))
         if not candidates:
             return None
         candidates.sort(reverse=True)
@@ -396,26 +754,29 @@ def serpapi_find_domain(
 
 def get_next_serper_key() -> Optional[str]:
     """
-    Get the next available Serper API key using round-robin rotation.
+    Get the currently active Serper API key (read under the key lock, see rotate_serper_key).
     Returns None if no keys are available.
     """
-    global CURRENT_SERPER_KEY_INDEX
     if not SERPER_API_KEYS:
         return None
-    key = SERPER_API_KEYS[CURRENT_SERPER_KEY_INDEX]
-    return key
+    with _SERPER_KEY_LOCK:
+        return SERPER_API_KEYS[CURRENT_SERPER_KEY_INDEX]
 
 
-def rotate_serper_key() -> bool:
+def rotate_serper_key(from_index: Optional[int] = None) -> bool:
     """
     Rotate to the next Serper API key.
+    With from_index, only rotate if that key is still the current one: when several threads
+    hit the same exhausted key, the key is skipped once instead of once per thread.
     Returns True if rotation was successful, False if no more keys available.
     """
     global CURRENT_SERPER_KEY_INDEX
     if len(SERPER_API_KEYS) <= 1:
         return False
-    CURRENT_SERPER_KEY_INDEX = (CURRENT_SERPER_KEY_INDEX + 1) % len(SERPER_API_KEYS)
-    print(f"   Rotating to Serper API key #{CURRENT_SERPER_KEY_INDEX + 1}")
+    with _SERPER_KEY_LOCK:
+        if from_index is None or from_index == CURRENT_SERPER_KEY_INDEX:
+            CURRENT_SERPER_KEY_INDEX = (CURRENT_SERPER_KEY_INDEX + 1) % len(SERPER_API_KEYS)
+            log(f"   Rotating to Serper API key #{CURRENT_SERPER_KEY_INDEX + 1}")
     return True
 
 
@@ -442,10 +803,11 @@ def serper_find_domain(
     
     for attempt in range(max_retries):
         # Use provided key or get from rotation
+        key_index = CURRENT_SERPER_KEY_INDEX  # snapshot; other threads may rotate meanwhile
         if api_key is None:
-            current_key = get_next_serper_key()
+            current_key = SERPER_API_KEYS[key_index] if SERPER_API_KEYS else None
             if not current_key:
-                print("   No Serper API keys available")
+                log("   No Serper API keys available")
                 return None
         else:
             current_key = api_key
@@ -457,36 +819,33 @@ def serper_find_domain(
                 "Content-Type": "application/json",
             }
             payload = {"q": query, "num": num, "hl": hl, "gl": gl}
+            RATE_LIMITER.set_interval(url, SEARCH_MIN_INTERVAL)
             resp = SESSION.post(url, headers=headers, json=payload, timeout=20)
             
             # Track usage
             if api_key is None:
-                SERPER_KEY_USAGE[CURRENT_SERPER_KEY_INDEX] += 1
+                with _SERPER_KEY_LOCK:
+                    SERPER_KEY_USAGE[key_index] += 1
             
             # Handle rate limiting
             if resp.status_code == 429:
-                print(f"   Serper API key #{CURRENT_SERPER_KEY_INDEX + 1} quota exceeded (429)")
+                log(f"   Serper API key #{key_index + 1} quota exceeded (429)")
                 if api_key is None and attempt < max_retries - 1:
-                    if rotate_serper_key():
+                    if rotate_serper_key(from_index=key_index):
                         continue  # Try next key
                 return None
             
             if resp.status_code != 200:
-                print(f"   Serper API returned status {resp.status_code}")
+                log(f"   Serper API returned status {resp.status_code}")
                 return None
             
-            data = resp.json() or {}
+            data = response_json(resp) or {}
             results = data.get("organic") or []
             if not isinstance(results, list):
                 return None
             
             # Take the first acceptable organic result to maximize chances,
             # while skipping obvious social/aggregator domains.
-            bad_hosts = {
-                "linkedin.com", "fr.linkedin.com", "facebook.com", "twitter.com", "x.com",
-                "societe.com", "societeinfo.com", "verif.com", "manageo.fr", "bloomberg.com",
-                "wikipedia.org", "indeed.fr", "welcometothejungle.com"
-            }
             for r in results:
                 link = r.get("link") or r.get("url")
                 if not link:
@@ -495,14 +854,14 @@ def serper_find_domain(
                 if not host:
                     continue
                 host_l = host.lower()
-                if any(host_l.endswith(bad) or host_l == bad for bad in bad_hosts):
+                if host_l.endswith(SERP_BAD_HOST_SUFFIXES):
                     continue
                 return host
             return None
         except Exception as e:
-            print(f"   Serper API exception: {e}")
+            log(f"   Serper API exception: {e}")
             if api_key is None and attempt < max_retries - 1:
-                rotate_serper_key()
+                rotate_serper_key(from_index=key_index)
                 continue
             return None
     
@@ -543,7 +902,6 @@ def fetch_establishments_by_naf_prefix(
             break
         if not got_any:
             break
-        time.sleep(sleep)
     return results
 
 
@@ -552,6 +910,7 @@ def fetch_establishments_by_naf_prefix_fallback_recherche(
     per_page: int,
     max_pages: int,
     sleep: float,
+    exclude_over_emp: Optional[int] = None,
 ) -> List[dict]:
     """
     Fallback using recherche-entreprises.api.gouv.fr, which often works even if
@@ -568,6 +927,8 @@ def fetch_establishments_by_naf_prefix_fallback_recherche(
             "page": page,
             "per_page": per_page,
         }
+        if exclude_over_emp is not None and exclude_over_emp >= 0:
+            params["tranche_effectif_salarie"] = ",".join(allowed_tranche_codes(exclude_over_emp))
         j = call_api(base, params=params, sleep=sleep)
         if not j:
             break
@@ -592,31 +953,85 @@ def fetch_establishments_by_naf_prefix_fallback_recherche(
         total = j.get("total_results") or j.get("total")
         if total and page * per_page >= int(total):
             break
-        time.sleep(sleep)
     return results
 
 
-def get_insee_access_token(client_id: str, client_secret: str, token_url: str) -> Optional[str]:
-    try:
-        r = SESSION.post(
-            token_url,
-            data={"grant_type": "client_credentials"},
-            auth=(client_id, client_secret),
-            headers={"Accept": "application/json"},
-            timeout=20,
-        )
-        if r.status_code == 200:
-            return r.json().get("access_token")
-        else:
-            print(f"   INSEE token error: HTTP {r.status_code}")
-            try:
-                print("   Response:", r.json())
-            except Exception:
-                pass
+# OAuth tokens already obtained: (client_id, token_url) -> (token, monotonic expiry)
+_INSEE_TOKENS: Dict[Tuple[str, str], Tuple[str, float]] = {}
+_INSEE_TOKEN_LOCK = threading.Lock()
+INSEE_TOKEN_TTL = 7 * 86400  # INSEE tokens last a week when the answer omits expires_in
+
+def get_insee_access_token(client_id: str, client_secret: str, token_url: str, refresh: bool = False) -> Optional[str]:
+    """Return an INSEE OAuth2 token, reused across NAF prefixes until shortly before it expires.
+    refresh=True discards the cached token (e.g. after a 401).
+    """
+    key = (client_id, token_url)
+    # Held during the request: concurrent NAF fetches wait for one token instead of each asking
+    with _INSEE_TOKEN_LOCK:
+        cached = _INSEE_TOKENS.get(key)
+        if cached and not refresh and time.monotonic() < cached[1]:
+            return cached[0]
+        try:
+            r = SESSION.post(
+                token_url,
+                data={"grant_type": "client_credentials"},
+                auth=(client_id, client_secret),
+                headers={"Accept": "application/json"},
+                timeout=20,
+            )
+            if r.status_code == 200:
+                j = response_json(r)
+                token = j.get("access_token")
+                if token:
+                    ttl = float(j.get("expires_in") or INSEE_TOKEN_TTL)
+                    _INSEE_TOKENS[key] = (token, time.monotonic() + ttl - 60)
+                return token
+            else:
+                log(f"   INSEE token error: HTTP {r.status_code}")
+                try:
+                    log("   Response:", response_json(r))
+                except Exception:
+                    pass
+                return None
+        except Exception as ex:
+            log("   INSEE token exception:", ex)
             return None
-    except Exception as ex:
-        print("   INSEE token exception:", ex)
-        return None
+
+
+def normalize_insee_etablissement(et: dict) -> dict:
+    """Normalize a subset of an INSEE /siret etablissement to our internal structure."""
+    ul = et.get("uniteLegale", {}) or {}
+    naf = ul.get("activitePrincipaleUniteLegale") or et.get("activitePrincipaleEtablissement")
+    return {
+        "siren": et.get("siren"),
+        "unite_legale": {"denomination": ul.get("denominationUniteLegale") or ul.get("nomUniteLegale")},
+        "activite_principale": naf,
+        "tranche_effectif_salarie": ul.get("trancheEffectifsUniteLegale") or et.get("trancheEffectifsEtablissement"),
+        "est_siege": et.get("etablissementSiege"),
+        "nom_raison_sociale": ul.get("denominationUniteLegale") or ul.get("nomUniteLegale"),
+    }
+
+
+def stream_insee_page(url: str, headers: dict, params: dict) -> Optional[List[dict]]:
+    """GET one INSEE /siret page and normalize its etablissements while the JSON is being parsed,
+    so the raw (multi-MB) document is never held in memory. Returns None on a non-200 answer,
+    except 401 (expired/invalid credentials) which raises requests.HTTPError.
+    """
+    with SESSION.get(url, headers=headers, params=params, timeout=25, stream=True) as r:
+        if r.status_code == 401:
+            r.raise_for_status()
+        if r.status_code != 200:
+            return None
+        if getattr(r, "from_cache", False):
+            # Replayed by --cache: the body is already in memory and r.raw cannot be streamed
+            source: Any = io.BytesIO(r.content)
+        else:
+            r.raw.decode_content = True  # let urllib3 undo gzip before ijson reads the stream
+            source = r.raw
+        return [
+            normalize_insee_etablissement(et)
+            for et in ijson.items(source, "etablissements.item", use_float=True)
+        ]
 
 
 def fetch_establishments_by_naf_prefix_insee(
@@ -626,14 +1041,19 @@ def fetch_establishments_by_naf_prefix_insee(
     sleep: float,
     token: str,
     base_url: str,
+    exclude_over_emp: Optional[int] = None,
+    refresh_token: Optional[Callable[[], Optional[str]]] = None,
 ) -> List[dict]:
     """
     Use INSEE SIRENE V3 API (OAuth2) to retrieve establishments by NAF prefix.
     Endpoint: /siret?q=activitePrincipale:{prefix}*&nombre={per_page}&debut={offset}
+    refresh_token, when given, is called once for a new token if the current one gets a 401.
     """
     headers = {"Authorization": f"Bearer {token}", "Accept": "application/json"}
     results: List[dict] = []
     field_options = ["activitePrincipaleUniteLegale", "activitePrincipaleEtablissement"]
+    # Size filter applied server-side so oversized companies are never downloaded
+    tranche_clause = insee_tranche_clause(exclude_over_emp)
     for page in range(1, max_pages + 1):
         success_this_page = False
         for field in field_options:
@@ -641,44 +1061,41 @@ def fetch_establishments_by_naf_prefix_insee(
             for term in naf_search_terms(naf_prefix):
                 offset = (page - 1) * per_page
                 params = {
-                    "q": f"{field}:{term}",
+                    "q": f"{field}:{term}{tranche_clause}",
                     "nombre": per_page,
                     "debut": offset,
                 }
                 url = f"{base_url}/siret"
+                RATE_LIMITER.set_interval(url, sleep)
                 try:
-                    r = SESSION.get(url, headers=headers, params=params, timeout=25)
-                    if r.status_code != 200:
+                    try:
+                        page_rows = stream_insee_page(url, headers, params)
+                    except requests.HTTPError:
+                        # 401: the token expired mid-run, get a fresh one and retry this query once
+                        token = refresh_token() if refresh_token else None
+                        refresh_token = None
+                        if not token:
+                            raise
+                        headers["Authorization"] = f"Bearer {token}"
+                        page_rows = stream_insee_page(url, headers, params)
+                    if page_rows is None:
                         # Try next term/field on error
                         continue
-                    j = r.json()
-                    etablissements = j.get("etablissements", [])
-                    if not etablissements:
+                    if not page_rows:
                         success_this_page = True
                         break
-                    # Normalize a subset of fields to our format
-                    for et in etablissements:
-                        ul = et.get("uniteLegale", {}) or {}
-                        naf = ul.get("activitePrincipaleUniteLegale") or et.get("activitePrincipaleEtablissement")
-                        normalized = {
-                            "siren": et.get("siren"),
-                            "unite_legale": {"denomination": ul.get("denominationUniteLegale") or ul.get("nomUniteLegale")},
-                            "activite_principale": naf,
-                            "tranche_effectif_salarie": ul.get("trancheEffectifsUniteLegale") or et.get("trancheEffectifsEtablissement"),
-                            "est_siege": et.get("etablissementSiege"),
-                            "nom_raison_sociale": ul.get("denominationUniteLegale") or ul.get("nomUniteLegale"),
-                        }
-                        results.append(normalized)
+                    results.extend(page_rows)
                     success_this_page = True
                     break
-                except Exception:
+                except (requests.RequestException, ijson.JSONError) as ex:
+                    # Network error or malformed page: report it, then try the next term/field
+                    log("   INSEE exception:", ex)
                     continue
             if success_this_page:
                 break
         if not success_this_page:
-            print("   INSEE fetch error: no valid query field worked for this page")
+            log("   INSEE fetch error: no valid query field worked for this page")
             break
-        time.sleep(sleep)
     return results
 
 
@@ -689,6 +1106,7 @@ def fetch_establishments_by_naf_prefix_insee_apikey(
     sleep: float,
     api_key: str,
     base_url: str,
+    exclude_over_emp: Optional[int] = None,
 ) -> List[dict]:
     """
     Use INSEE SIRENE 3.11 API with public API key header (X-INSEE-Api-Key-Integration).
@@ -700,62 +1118,130 @@ def fetch_establishments_by_naf_prefix_insee_apikey(
     }
     results: List[dict] = []
     field_options = ["activitePrincipaleUniteLegale", "activitePrincipaleEtablissement"]
+    # Size filter applied server-side so oversized companies are never downloaded
+    tranche_clause = insee_tranche_clause(exclude_over_emp)
     for page in range(1, max_pages + 1):
         success_this_page = False
         for field in field_options:
             for term in naf_search_terms(naf_prefix):
                 offset = (page - 1) * per_page
                 params = {
-                    "q": f"{field}:{term}",
+                    "q": f"{field}:{term}{tranche_clause}",
                     "nombre": per_page,
                     "debut": offset,
                 }
                 url = f"{base_url}/siret"
+                RATE_LIMITER.set_interval(url, sleep)
                 try:
-                    r = SESSION.get(url, headers=headers, params=params, timeout=25)
-                    if r.status_code != 200:
+                    page_rows = stream_insee_page(url, headers, params)
+                    if page_rows is None:
                         continue
-                    j = r.json()
-                    etablissements = j.get("etablissements", [])
-                    if not etablissements:
+                    if not page_rows:
                         success_this_page = True
                         break
-                    for et in etablissements:
-                        ul = et.get("uniteLegale", {}) or {}
-                        naf = ul.get("activitePrincipaleUniteLegale") or et.get("activitePrincipaleEtablissement")
-                        normalized = {
-                            "siren": et.get("siren"),
-                            "unite_legale": {"denomination": ul.get("denominationUniteLegale") or ul.get("nomUniteLegale")},
-                            "activite_principale": naf,
-                            "tranche_effectif_salarie": ul.get("trancheEffectifsUniteLegale") or et.get("trancheEffectifsEtablissement"),
-                            "est_siege": et.get("etablissementSiege"),
-                            "nom_raison_sociale": ul.get("denominationUniteLegale") or ul.get("nomUniteLegale"),
-                        }
-                        results.append(normalized)
+                    results.extend(page_rows)
                     success_this_page = True
                     break
-                except Exception as ex:
-                    print("   INSEE API key exception:", ex)
+                except (requests.RequestException, ijson.JSONError) as ex:
+                    log("   INSEE API key exception:", ex)
                     continue
             if success_this_page:
                 break
         if not success_this_page:
-            print("   INSEE API key fetch error: no valid query field worked for this page")
+            log("   INSEE API key fetch error: no valid query field worked for this page")
             break
-        time.sleep(sleep)
     return results
 
 
 def get_enterprise_by_siren(siren: str, sleep: float) -> Optional[dict]:
     base = f"https://entreprise.data.gouv.fr/api/sirene/v3/entreprises/{siren}"
-    j = call_api(base)
-    time.sleep(sleep)
-    return j
+    return call_api(base, sleep=sleep)
+
+
+def prefetch_enterprises(sirens: List[str], sleep: float) -> Dict[str, Optional[dict]]:
+    """Fetch enterprise records for many SIRENs concurrently, before the per-candidate loop.
+    The pool shares the host's rate limiter, so calls stay `sleep` seconds apart overall.
+    """
+    if not sirens:
+        return {}
+    with ThreadPoolExecutor(max_workers=ENRICH_WORKERS) as ex:
+        return dict(zip(sirens, ex.map(lambda s: get_enterprise_by_siren(s, sleep), sirens)))
+
+
+def serp_query_extra(naf: Optional[str]) -> str:
+    """Keywords appended to the homepage search query to improve precision for some NAF codes."""
+    naf_str = (naf or "").strip().upper()
+    if naf_str.startswith("71.12B"):
+        return " conseil"
+    if naf_str.startswith("62.02A"):
+        return " ESN SSII"
+    return ""
+
+def homepage_cache_key(name: str, naf: Optional[str]) -> str:
+    """Homepage cache key: company name normalized without legal forms, plus the query keywords
+    derived from the NAF code (they change the search results)."""
+    name_key = _WS_RE.sub(" ", _LEGAL_FORM_RE.sub(" ", normalize_string(name))).strip()
+    if not name_key:
+        return ""
+    return f"{name_key}|{serp_query_extra(naf).strip().lower()}"
+
+class HomepageCache:
+    """Search inputs (see homepage_cache_key) -> (domain, site_source) of the homepage found.
+    Only used with --homepage-cache, since it deliberately gives homonymous companies the same
+    homepage. Lookups are memoized for the run, misses included, and found homepages are stored
+    in a sqlite file so later runs skip the paid SerpAPI/serper.dev queries for them.
+    """
+
+    def __init__(self) -> None:
+        self._memo: Dict[str, Tuple[str, ...]] = {}
+        self._db: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        # One lock per key: workers looking up the same name wait for the first search
+        self._key_locks: Dict[str, threading.Lock] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self._db is not None
+
+    def key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = self._key_locks[key] = threading.Lock()
+            return lock
+
+    def open(self, path: str) -> None:
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("CREATE TABLE IF NOT EXISTS homepages (name TEXT PRIMARY KEY, domain TEXT, source TEXT)")
+        self._db.commit()
+
+    def get(self, key: str) -> Optional[Tuple[str, ...]]:
+        """(domain, source) when known, () for a name already searched in vain, None if never seen."""
+        with self._lock:
+            hit = self._memo.get(key)
+            if hit is None and self._db is not None:
+                row = self._db.execute("SELECT domain, source FROM homepages WHERE name = ?", (key,)).fetchone()
+                if row:
+                    hit = self._memo[key] = tuple(row)
+            return hit
+
+    def put(self, key: str, domain: Optional[str], source: Optional[str]) -> None:
+        with self._lock:
+            if not domain:
+                self._memo[key] = ()  # misses are only remembered for this run
+                return
+            self._memo[key] = (domain, source or "")
+            if self._db is not None:
+                self._db.execute("INSERT OR REPLACE INTO homepages VALUES (?, ?, ?)", (key, domain, source))
+                self._db.commit()
+
+
+HOMEPAGE_CACHE = HomepageCache()
 
 
 # ---------------- Data structures ----------------
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedCandidate:
     siren: Optional[str]
     nom: str
@@ -776,14 +1262,101 @@ class ProcessedCandidate:
     signals: Dict[str, Any]
 
 
+# Output column order (one column per ProcessedCandidate field)
+CANDIDATE_COLUMNS = [f.name for f in fields(ProcessedCandidate)]
+# Reads all fields of a candidate as a tuple in one call (no asdict deep copy)
+candidate_values = operator.attrgetter(*CANDIDATE_COLUMNS)
+_SIGNALS_POS = CANDIDATE_COLUMNS.index("signals")
+_score_of = operator.itemgetter(CANDIDATE_COLUMNS.index("score"))
+_is_pertinent = operator.itemgetter(CANDIDATE_COLUMNS.index("pertinent_for_clustor"))
+
+def candidate_row(pc: ProcessedCandidate) -> Tuple[Any, ...]:
+    """Return the CSV values of a candidate, signals stringified as JSON for readability.
+    Uses json.dumps' default separators: the column's text is unchanged for downstream readers.
+    """
+    values = candidate_values(pc)
+    return values[:_SIGNALS_POS] + (json.dumps(pc.signals, ensure_ascii=False),) + values[_SIGNALS_POS + 1:]
+
+
 # ---------------- Processing ----------------
 
+def find_homepage(
+    search_name: str,
+    naf: Optional[str],
+    use_serpapi: bool = False,
+    serpapi_key: Optional[str] = None,
+    serpapi_num: int = 5,
+    serpapi_engine: str = "google",
+    serpapi_hl: str = "fr",
+    serpapi_gl: str = "fr",
+    use_serper: bool = False,
+) -> Optional[Tuple[Optional[str], str, str]]:
+    """Look for a company homepage with the search engines, then heuristic guesses.
+    Returns (domain, site_source, html) for the first guess that answered, else None.
+    """
+    guessed_domains: List[str] = []
+    # Tailor query keywords by NAF to improve precision (France locale via hl/gl=fr)
+    q = f"{search_name}{serp_query_extra(naf)} site officiel"
+    # Confidence is judged on the company name only: the words appended to the query
+    # ("site officiel", NAF keywords) would otherwise match unrelated hosts
+    name_tokens = serp_query_tokens(search_name)
+    serp_confident = False
+    # Provenance of the search-engine answers, used for site_source
+    serp_dom: Optional[str] = None
+    sp_dom: Optional[str] = None
+    # SerpAPI first if enabled
+    if use_serpapi and serpapi_key:
+        serp_dom = serpapi_find_domain(q, serpapi_key, engine=serpapi_engine, num=serpapi_num, hl=serpapi_hl, gl=serpapi_gl)
+        if serp_dom:
+            guessed_domains.append(serp_dom)
+            serp_confident = score_serp_host(serp_dom, name_tokens) >= SERP_CONFIDENT_SCORE
+    # serper.dev next if enabled
+    if use_serper and SERPER_API_KEYS:
+        # We only need the first result; request 1 to reduce cost.
+        # Pass api_key=None to use the rotation system
+        sp_dom = serper_find_domain(q, api_key=None, num=1, hl=serpapi_hl, gl=serpapi_gl)
+        if sp_dom:
+            guessed_domains.append(sp_dom)
+            serp_confident = serp_confident or score_serp_host(sp_dom, name_tokens) >= SERP_CONFIDENT_SCORE
+    # Heuristic guesses, only when no search engine gave a confident answer
+    if not serp_confident:
+        guessed_domains.extend(guess_domain_from_name(search_name))
+    # De-dup while preserving order
+    ordered = list(dict.fromkeys(guessed_domains))
+    # Probe all guesses concurrently, then keep the first one (in priority order) that answered
+    urls = [ensure_http(g) for g in ordered]
+    for g, url, html in zip(ordered, urls, http_get_many(urls)):
+        if html:
+            site_source = "serpapi" if g == serp_dom else ("serper" if g == sp_dom else "guess")
+            return extract_domain_from_url(url), site_source, html
+    return None
+
+def find_homepage_cached(search_name: str, naf: Optional[str], **search: Any) -> Optional[Tuple[Optional[str], str, str]]:
+    """find_homepage() behind HOMEPAGE_CACHE (when --homepage-cache is on), keyed by name and NAF keywords."""
+    key = homepage_cache_key(search_name, naf)
+    if not key or not HOMEPAGE_CACHE.enabled:
+        return find_homepage(search_name, naf, **search)
+    # Held during the search so that a second worker with the same key reuses its result
+    with HOMEPAGE_CACHE.key_lock(key):
+        cached = HOMEPAGE_CACHE.get(key)
+        if cached == ():
+            return None
+        if cached:
+            cached_domain, cached_source = cached
+            html = http_get_html(ensure_http(cached_domain))
+            if html:
+                return cached_domain, cached_source, html
+        found = find_homepage(search_name, naf, **search)
+        HOMEPAGE_CACHE.put(key, found[0] if found else None, found[1] if found else None)
+        return found
+
+
 def process_candidate(
     e: dict,
-    naf_prefixes: List[str],
+    naf_prefixes: Tuple[str, ...],
     min_emp: int,
     max_emp: int,
-    sleep: float,
+    enterprise: Optional[dict] = None,
     web_scan: bool = True,
     use_serpapi: bool = False,
     serpapi_key: Optional[str] = None,
@@ -818,8 +1391,7 @@ def process_candidate(
 
     website: Optional[str] = None
     if web_scan:
-        # enterprise-level fetch (rarely provides website in SIRENE, but try)
-        enterprise = get_enterprise_by_siren(siren, sleep)
+        # enterprise-level record, prefetched by the caller (rarely provides website in SIRENE, but try)
         if enterprise and isinstance(enterprise, dict):
             # Non-standard: some datasets mirror a website; SIRENE itself usually doesn't
             website = (
@@ -831,6 +1403,9 @@ def process_candidate(
     homepage_html: Optional[str] = None
     domain: Optional[str] = None
     signals: Dict[str, Any] = {"name_keywords": [], "site_keywords": [], "job_posting": False}
+    if e.get("_extra_nafs"):
+        # Other NAF codes seen for this SIREN in duplicate rows (merged before processing)
+        signals["extra_nafs"] = e["_extra_nafs"]
     site_source: Optional[str] = None
     score = 0
     naf_ok = False
@@ -842,16 +1417,14 @@ def process_candidate(
     pertinent_for_clustor = False
 
     # Score: NAF
-    if naf and any(str(naf).startswith(code) for code in naf_prefixes):
+    if naf and str(naf).startswith(naf_prefixes):
         score += SCORE_RULES["naf"]
     # pertinence naf_ok based on refined target list
-    if naf and any(str(naf).startswith(code) for code in NAF_CODES_TARGET):
+    if naf and str(naf).startswith(NAF_CODES_TARGET_T):
         naf_ok = True
 
     # Score: name keywords
-    for k in NAME_KEYWORDS:
-        if normalize_string(k) in denom_norm:
-            signals["name_keywords"].append(k)
+    signals["name_keywords"] = match_keywords(denom_norm, NAME_KEYWORDS)
     if signals["name_keywords"]:
         score += SCORE_RULES["name_keyword"]
         name_keyword_found = True
@@ -869,92 +1442,67 @@ def process_candidate(
 
         # If no confirmed site, guess from company name
         if not homepage_html:
-            guessed_domains: List[str] = []
-            # SerpAPI first if enabled
-            if use_serpapi and serpapi_key:
-                search_name = (e.get("nom_complet_annuaire") or denom).strip()
-                # Tailor query keywords by NAF to improve precision
-                naf_str = (naf or "").strip().upper()
-                extra = ""
-                if naf_str.startswith("71.12B"):
-                    extra = " conseil"
-                elif naf_str.startswith("62.02A"):
-                    extra = " ESN SSII"
-                q = f"{search_name}{extra} site officiel"
-                serp_dom = serpapi_find_domain(q, serpapi_key, engine=serpapi_engine, num=serpapi_num, hl=serpapi_hl, gl=serpapi_gl)
-                if serp_dom:
-                    guessed_domains.append(serp_dom)
-            # serper.dev next if enabled
-            if use_serper and SERPER_API_KEYS:
-                search_name = (e.get("nom_complet_annuaire") or denom).strip()
-                # Tailor query keywords by NAF for serper.dev (France locale via hl/gl=fr)
-                naf_str = (naf or "").strip().upper()
-                extra = ""
-                if naf_str.startswith("71.12B"):
-                    extra = " conseil"
-                elif naf_str.startswith("62.02A"):
-                    extra = " ESN SSII"
-                q = f"{search_name}{extra} site officiel"
-                # We only need the first result; request 1 to reduce cost.
-                # Pass api_key=None to use the rotation system
-                sp_dom = serper_find_domain(q, api_key=None, num=1, hl=serpapi_hl, gl=serpapi_gl)
-                if sp_dom:
-                    guessed_domains.append(sp_dom)
-            # Heuristic guesses
-            guessed_domains.extend(guess_domain_from_name(search_name))
-            # De-dup while preserving order
-            seen = set()
-            ordered = []
-            for d in guessed_domains:
-                if d not in seen:
-                    seen.add(d)
-                    ordered.append(d)
-            for g in ordered:
-                url = ensure_http(g)
-                html = http_get_html(url)
-                if html:
-                    homepage_html = html
-                    domain = extract_domain_from_url(url)
-                    site_source = (
-                        "serpapi" if 'serp_dom' in locals() and g == serp_dom else
-                        ("serper" if 'sp_dom' in locals() and g == sp_dom else "guess")
-                    )
-                    break
-                time.sleep(0.3)
+            search_name = (e.get("nom_complet_annuaire") or denom).strip()
+            found = find_homepage_cached(
+                search_name,
+                naf,
+                use_serpapi=use_serpapi,
+                serpapi_key=serpapi_key,
+                serpapi_num=serpapi_num,
+                serpapi_engine=serpapi_engine,
+                serpapi_hl=serpapi_hl,
+                serpapi_gl=serpapi_gl,
+                use_serper=use_serper,
+            )
+            if found:
+                domain, site_source, homepage_html = found
 
-        # If homepage found, lightly probe a few candidate paths for stronger signals
+        # If homepage found, lightly probe a few candidate paths for stronger signals.
+        # Pages are analyzed as they arrive (visible text only, markup and scripts are not scanned)
+        # so that probing stops as soon as both site signals have fired.
         pages_scanned = 0
-        texts_to_scan: List[str] = []
+        found_site: Set[str] = set()
+        job_found = False
+        # Hashes of the page texts kept so far: many small sites (SPAs) serve the same body on every path
+        seen_texts: Set[int] = set()
         if homepage_html:
-            texts_to_scan.append(homepage_html)
+            homepage_text = html_to_text(homepage_html)
+            seen_texts.add(hash(homepage_text))
             pages_scanned += 1
+            site_kw, job_found = analyze_text(normalize_string(homepage_text))
+            found_site.update(site_kw)
             if domain:
                 base = f"http://{domain}"
-                for p in CANDIDATE_PATHS:
-                    if pages_scanned >= 5:  # cap to be polite
+                paths = list(CANDIDATE_PATHS)
+                while pages_scanned < MAX_PAGES_PER_SITE:
+                    # Only the paths that may still reveal a missing signal
+                    paths = [
+                        p for p in paths
+                        if (p in SERVICE_PATHS and not found_site) or (p in JOB_PATHS and not job_found)
+                    ]
+                    if not paths:
                         break
-                    url = urljoin(base, p)
-                    html = http_get_html(url)
-                    if html and len(html) > 1000:  # avoid tiny stubs
-                        texts_to_scan.append(html)
-                        pages_scanned += 1
-                    time.sleep(0.2)
-
-        # Analyze collected texts
-        if texts_to_scan:
-            combined = "\n\n".join(texts_to_scan)
-            found_site = find_keywords_in_text(combined, SITE_KEYWORDS)
-            signals["site_keywords"] = sorted(set(found_site))
+                    # Probe paths concurrently, in batches no larger than the remaining page budget,
+                    # so the cap still bounds the number of pages kept from one site
+                    budget = MAX_PAGES_PER_SITE - pages_scanned
+                    batch, paths = paths[:budget], paths[budget:]
+                    for html in http_get_many([base + p for p in batch], fetch=http_probe_html):
+                        if html and len(html) > 1000:  # avoid tiny stubs
+                            text = html_to_text(html)
+                            text_hash = hash(text)
+                            if text_hash not in seen_texts:  # identical bodies are scanned only once
+                                seen_texts.add(text_hash)
+                                site_kw, job_kw = analyze_text(normalize_string(text))
+                                found_site.update(site_kw)
+                                job_found = job_found or job_kw
+                            pages_scanned += 1
+
+        if pages_scanned:
+            signals["site_keywords"] = sorted(found_site)
             if found_site:
                 score += SCORE_RULES["site_keyword"]
                 site_keyword_found = True
-
-            # crude job posting check
-            job_found = any(t in combined.lower() for t in [
-                "offre", "recrutement", "carriere", "carri\u00e8res", "careers", "job",
-                "poste", "recrute", "candidat", "join us"
-            ])
-            signals["job_posting"] = bool(job_found)
+            signals["job_posting"] = job_found
             if job_found:
                 score += SCORE_RULES["job_posting"]
                 job_posting_present = True
@@ -967,7 +1515,7 @@ def process_candidate(
             if tranche not in {"00", "0", "0-0"}:
                 size_ok = True
                 # pertinence: try to detect if numbers suggest range 10-500
-                nums = [int(n) for n in re.findall(r"\d+", tranche)]
+                nums = tranche_numbers(tranche)
                 if nums:
                     # If any numeric hint within range, accept
                     if any(DEFAULT_MIN_EMP <= n <= DEFAULT_MAX_EMP for n in nums):
@@ -1015,6 +1563,42 @@ def process_candidate(
     )
 
 
+# ---------------- Export ----------------
+
+def open_resume_db(path: str) -> sqlite3.Connection:
+    """Open (creating it if needed) the table of already processed SIREN used by --resume.
+    Each row is stored as a JSON object keyed by column name, so adding a column does not
+    invalidate older entries, next to the options that produced it (see resume_options).
+    """
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE IF NOT EXISTS processed (siren TEXT PRIMARY KEY, row TEXT, ts INTEGER, opts TEXT)")
+    # Tables created before the opts column: their rows never match and get recomputed
+    if "opts" not in {col[1] for col in conn.execute("PRAGMA table_info(processed)")}:
+        conn.execute("ALTER TABLE processed ADD COLUMN opts TEXT")
+    conn.commit()
+    return conn
+
+def resume_options(args: argparse.Namespace) -> str:
+    """The options a --resume row depends on, as a JSON string: rows recorded under other
+    options (e.g. a --no-web-scan connectivity check) are recomputed instead of reused.
+    """
+    return json_dumps({
+        "naf_codes": args.naf_codes,
+        "min_emp": args.min_emp,
+        "max_emp": args.max_emp,
+        "web_scan": not args.no_web_scan,
+        "serpapi": [args.serpapi_engine, args.serpapi_num, args.serpapi_hl, args.serpapi_gl] if args.use_serpapi and args.serpapi_key else None,
+        "serper": bool(args.use_serper and SERPER_API_KEYS),
+    })
+
+def write_csv(rows: List[Tuple[Any, ...]], path: Path) -> None:
+    """Write candidate rows (see candidate_row) under a CANDIDATE_COLUMNS header."""
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(CANDIDATE_COLUMNS)
+        writer.writerows(rows)
+
+
 # ---------------- Main ----------------
 
 def parse_args() -> argparse.Namespace:
@@ -1024,8 +1608,13 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--max-emp", type=int, default=DEFAULT_MAX_EMP, help="Maximum employees (heuristic)")
     p.add_argument("--per-page", type=int, default=DEFAULT_PER_PAGE, help="Results per API page (<=100 recommended)")
     p.add_argument("--max-pages", type=int, default=DEFAULT_MAX_PAGES, help="Max pages per NAF prefix to fetch")
-    p.add_argument("--sleep", type=float, default=DEFAULT_SLEEP, help="Sleep between network calls (seconds)")
+    p.add_argument("--sleep", type=float, default=DEFAULT_SLEEP, help="Minimum delay between calls to the same API host (seconds)")
+    p.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help=f"Number of candidates processed concurrently (default: {DEFAULT_WORKERS})")
     p.add_argument("--outfile", type=str, default=DEFAULT_OUTFILE, help="Output CSV path")
+    p.add_argument("--cache", action="store_true", help=f"Cache SIRENE/INSEE/SERP API responses on disk ({DEFAULT_API_CACHE}, {API_CACHE_TTL // 3600}h) to speed up re-runs")
+    p.add_argument("--homepage-cache", action="store_true", help=f"Remember the homepage found for each company name in ./{DEFAULT_HOMEPAGE_CACHE} and skip the web search for it on later runs")
+    p.add_argument("--resume", action="store_true", help=f"Record each processed SIREN in ./{DEFAULT_RESUME_DB} and skip the ones already there (to resume an interrupted run)")
+    p.add_argument("--http-cache", action="store_true", help=f"Keep fetched web pages gzip-compressed in ./{DEFAULT_HTML_CACHE_DIR} and reuse them on later runs")
     # Recherche d'entreprises API
     p.add_argument("--use-recherche", action="store_true", help="Use Recherche d'entreprises API as primary data source")
     p.add_argument("--exclude-over-emp", type=int, default=DEFAULT_EXCLUDE_OVER_EMP, help="Exclude companies whose tranche suggests more than N employees (default: 2000). Set to -1 to disable.")
@@ -1069,30 +1658,96 @@ def print_serper_usage_summary():
     print("="*60 + "\n")
 
 
+def fetch_naf_establishments(naf: str, args: argparse.Namespace) -> List[dict]:
+    """Fetch establishments for one NAF code, trying each enabled data source in turn."""
+    log(f"Fetching NAF prefix: {naf}")
+    ests: List[dict] = []
+
+    # 0) Recherche d'entreprises (primary if requested)
+    if args.use_recherche:
+        ests = fetch_establishments_by_naf_prefix_recherche(
+            naf_code=naf,
+            per_page=args.per_page,
+            max_pages=args.max_pages,
+            sleep=args.sleep,
+            exclude_over_emp=args.exclude_over_emp,
+        )
+
+    # 1) INSEE (API Key) if requested and key provided and nothing fetched yet
+    if not ests and args.use_insee and args.insee_api_key:
+        ests = fetch_establishments_by_naf_prefix_insee_apikey(
+            naf, args.per_page, args.max_pages, args.sleep, args.insee_api_key, args.insee_base,
+            exclude_over_emp=args.exclude_over_emp,
+        )
+
+    # 2) INSEE (OAuth2) if requested and creds provided (fallback option if key not given)
+    if not ests and args.use_insee and args.insee_client_id and args.insee_client_secret:
+        # Cached: only the first NAF prefix actually requests a token
+        token = get_insee_access_token(args.insee_client_id, args.insee_client_secret, args.insee_token_url)
+        if token:
+            ests = fetch_establishments_by_naf_prefix_insee(
+                naf, args.per_page, args.max_pages, args.sleep, token, args.insee_base,
+                exclude_over_emp=args.exclude_over_emp,
+                refresh_token=lambda: get_insee_access_token(
+                    args.insee_client_id, args.insee_client_secret, args.insee_token_url, refresh=True
+                ),
+            )
+        else:
+            log("   INSEE token retrieval failed; will try public endpoints…")
+
+    # 3) Public entreprise.data.gouv.fr (may be blocked on some networks)
+    if not ests and not args.insee_only:
+        ests = fetch_establishments_by_naf_prefix(naf, args.per_page, args.max_pages, args.sleep)
+
+    # 4) Fallback recherche-entreprises (open endpoint, then local filter)
+    if not ests and not args.insee_only:
+        log("   Primary endpoint returned 0 or failed; trying fallback API…")
+        ests = fetch_establishments_by_naf_prefix_fallback_recherche(
+            naf, args.per_page, args.max_pages, args.sleep, exclude_over_emp=args.exclude_over_emp
+        )
+    return ests
+
+
 def main() -> None:
+    global SESSION, HTML_CACHE_DIR
     args = parse_args()
+    # Resolved once for the ping and every NAF prefix
+    args.insee_base = args.insee_base or INSEE_SIRENE_BASE
+    args.insee_token_url = args.insee_token_url or INSEE_TOKEN_URL
+    # Every candidate worker and every page-fetch thread may hold a connection at the same time
+    pool_size = max(HTTP_POOL_SIZE, args.workers + FETCH_CONCURRENCY)
+    if args.cache or pool_size != HTTP_POOL_SIZE:
+        SESSION = build_session(cache_path=DEFAULT_API_CACHE if args.cache else None, pool_size=pool_size)
+    if args.cache:
+        print("API response cache enabled:", DEFAULT_API_CACHE)
+    if args.homepage_cache:
+        HOMEPAGE_CACHE.open(DEFAULT_HOMEPAGE_CACHE)
+        print("Homepage lookup cache enabled:", DEFAULT_HOMEPAGE_CACHE)
+    if args.http_cache:
+        HTML_CACHE_DIR = Path(DEFAULT_HTML_CACHE_DIR)
+        HTML_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        print("Web page cache enabled:", HTML_CACHE_DIR)
     naf_codes = [c.strip() for c in args.naf_codes.split(",") if c.strip()]
     print("Collecting from SIRENE by NAF prefixes:", naf_codes)
 
     # Optional connectivity ping
     if args.ping_insee:
-        insee_base = args.insee_base or INSEE_SIRENE_BASE
         # Try API key first
         if args.insee_api_key:
             test = fetch_establishments_by_naf_prefix_insee_apikey(
                 naf_prefix=naf_codes[0], per_page=1, max_pages=1, sleep=args.sleep,
-                api_key=args.insee_api_key, base_url=insee_base
+                api_key=args.insee_api_key, base_url=args.insee_base
             )
             ok = len(test) > 0
             print("INSEE API key connectivity:", "OK" if ok else "FAIL")
             sys.exit(0 if ok else 2)
         # Else try OAuth if creds present
         if args.insee_client_id and args.insee_client_secret:
-            token = get_insee_access_token(args.insee_client_id, args.insee_client_secret, args.insee_token_url or INSEE_TOKEN_URL)
+            token = get_insee_access_token(args.insee_client_id, args.insee_client_secret, args.insee_token_url)
             if token:
                 test = fetch_establishments_by_naf_prefix_insee(
                     naf_prefix=naf_codes[0], per_page=1, max_pages=1, sleep=args.sleep,
-                    token=token, base_url=insee_base
+                    token=token, base_url=args.insee_base
                 )
                 ok = len(test) > 0
                 print("INSEE OAuth connectivity:", "OK" if ok else "FAIL")
@@ -1100,95 +1755,115 @@ def main() -> None:
         print("No INSEE credentials provided for ping.")
         sys.exit(2)
 
-    all_estabs: List[dict] = []
-    for naf in naf_codes:
-        print(f"Fetching NAF prefix: {naf}")
-        ests: List[dict] = []
-
-        insee_base = args.insee_base or INSEE_SIRENE_BASE
-        insee_token_url = args.insee_token_url or INSEE_TOKEN_URL
-
-        # 0) Recherche d'entreprises (primary if requested)
-        if args.use_recherche:
-            ests = fetch_establishments_by_naf_prefix_recherche(
-                naf_code=naf,
-                per_page=args.per_page,
-                max_pages=args.max_pages,
-                sleep=args.sleep,
-                exclude_over_emp=args.exclude_over_emp,
-            )
-
-        # 1) INSEE (API Key) if requested and key provided and nothing fetched yet
-        if not ests and args.use_insee and args.insee_api_key:
-            ests = fetch_establishments_by_naf_prefix_insee_apikey(
-                naf, args.per_page, args.max_pages, args.sleep, args.insee_api_key, insee_base
-            )
+    # Each NAF prefix runs its own fallback chain; prefixes are independent so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=max(1, len(naf_codes))) as ex:
+        per_naf = list(ex.map(lambda naf: fetch_naf_establishments(naf, args), naf_codes))
 
-        # 2) INSEE (OAuth2) if requested and creds provided (fallback option if key not given)
-        if not ests and args.use_insee and args.insee_client_id and args.insee_client_secret:
-            token = get_insee_access_token(args.insee_client_id, args.insee_client_secret, insee_token_url)
-            if token:
-                ests = fetch_establishments_by_naf_prefix_insee(naf, args.per_page, args.max_pages, args.sleep, token, insee_base)
-            else:
-                print("   INSEE token retrieval failed; will try public endpoints…")
-
-        # 3) Public entreprise.data.gouv.fr (may be blocked on some networks)
-        if not ests and not args.insee_only:
-            ests = fetch_establishments_by_naf_prefix(naf, args.per_page, args.max_pages, args.sleep)
-
-        # 4) Fallback recherche-entreprises (open endpoint, then local filter)
-        if not ests and not args.insee_only:
-            print("   Primary endpoint returned 0 or failed; trying fallback API…")
-            ests = fetch_establishments_by_naf_prefix_fallback_recherche(
-                naf, args.per_page, args.max_pages, args.sleep
-            )
+    all_estabs: List[dict] = []
+    for naf, ests in zip(naf_codes, per_naf):
         if not ests and args.insee_only:
-            print("   INSEE-only mode: no data fetched from INSEE; exiting.")
+            print(f"   INSEE-only mode: no data fetched from INSEE for prefix {naf}; exiting.")
             sys.exit(2)
         print(f" -> got {len(ests)} rows for prefix {naf}")
         all_estabs.extend(ests)
 
     print("Total raw establishments:", len(all_estabs))
 
-    # De-dup by SIREN (enterprise level)
-    by_siren: Dict[str, dict] = {}
-    for e in all_estabs:
-        s = e.get("siren")
-        if s:
-            # Prefer siège if multiple establishments show up
-            if s not in by_siren or (e.get("est_siege") is True):
-                by_siren[s] = e
-
-    print("Unique SIREN:", len(by_siren))
-
-    processed: List[ProcessedCandidate] = []
-    total = len(by_siren)
-    for i, (siren, e) in enumerate(by_siren.items(), start=1):
-        # Early filter: drop companies with zero employees unless explicitly included
-        tranche_pre = (
-            e.get("tranche_effectif_salarie")
-            or e.get("tranche_effectifs")
-            or None
-        )
-        if not args.include_zero_employees and indicates_zero_employees(tranche_pre):
+    # Mechanical per-establishment checks run on a frame of the few fields they need, not in a Python loop
+    df_raw = pd.DataFrame({
+        "siren": [e.get("siren") for e in all_estabs],
+        "naf": [e.get("activite_principale") for e in all_estabs],
+        "siege": [e.get("est_siege") is True for e in all_estabs],
+        "tranche": [e.get("tranche_effectif_salarie") or e.get("tranche_effectifs") or None for e in all_estabs],
+    })
+    df_raw = df_raw[df_raw["siren"].notna() & (df_raw["siren"] != "")]
+    # NAF codes seen for each SIREN, in order of appearance
+    nafs_by_siren = (
+        df_raw.dropna(subset=["naf"]).drop_duplicates(["siren", "naf"])
+        .groupby("siren", sort=False)["naf"].agg(list)
+    )
+    # De-dup by SIREN (enterprise level) so overlapping NAF codes are only web-scanned once;
+    # the siège is preferred when several establishments show up (stable sort keeps the first otherwise)
+    df = df_raw.sort_values("siege", ascending=False, kind="stable").drop_duplicates("siren").sort_index()
+    print("Unique SIREN:", len(df))
+
+    # Early filters on the tranche, before any network call. Only a handful of distinct tranche
+    # values exist, so each predicate is evaluated once per value and matched against the column.
+    tranches = df["tranche"].dropna().unique()
+    keep = pd.Series(True, index=df.index)
+    if not args.include_zero_employees:
+        # Drop companies with zero employees unless explicitly included
+        zero = df["tranche"].isin([t for t in tranches if indicates_zero_employees(t)])
+        for siren, tranche_pre in df.loc[zero, ["siren", "tranche"]].itertuples(index=False):
             print(f"Skipping SIREN {siren} - zero employees (tranche={tranche_pre})")
-            continue
-        if args.exclude_over_emp is not None and args.exclude_over_emp >= 0 and tranche_above_threshold(tranche_pre, args.exclude_over_emp):
+        keep &= ~zero
+    if args.exclude_over_emp is not None and args.exclude_over_emp >= 0:
+        over = df["tranche"].isin([t for t in tranches if tranche_above_threshold(t, args.exclude_over_emp)])
+        for siren, tranche_pre in df.loc[keep & over, ["siren", "tranche"]].itertuples(index=False):
             print(f"Skipping SIREN {siren} - above {args.exclude_over_emp} employees (tranche={tranche_pre})")
-            continue
-        display_name = (
-            (e.get("unite_legale", {}) or {}).get("denomination")
-            or e.get("nom_raison_sociale")
-            or ""
-        )
-        print(f"[{i}/{total}] Processing SIREN {siren} - {display_name[:40]}")
-        try:
-            row = process_candidate(
+        keep &= ~over
+
+    candidates: List[Tuple[str, dict]] = []
+    for idx, siren, naf_e in df.loc[keep, ["siren", "naf"]].itertuples():
+        e = all_estabs[idx]
+        # Keep the NAF codes of merged duplicates next to the retained establishment
+        extra_nafs = [n for n in nafs_by_siren.get(siren, []) if n != naf_e]
+        if extra_nafs:
+            e["_extra_nafs"] = extra_nafs
+        candidates.append((siren, e))
+
+    # Position of each SIREN in the candidate list: ties on the score keep this order in the output
+    candidate_pos = {siren: pos for pos, (siren, _) in enumerate(candidates)}
+
+    # Rows already computed by an earlier (possibly interrupted) --resume run are reused as is
+    resume_db: Optional[sqlite3.Connection] = None
+    resumed: Dict[str, Tuple[Any, ...]] = {}
+    if args.resume:
+        resume_db = open_resume_db(DEFAULT_RESUME_DB)
+        run_opts = resume_options(args)
+        wanted = {siren for siren, _ in candidates}
+        stale = 0
+        for siren, row_json, opts in resume_db.execute("SELECT siren, row, opts FROM processed"):
+            if siren not in wanted:
+                continue
+            if opts != run_opts:
+                stale += 1
+                continue
+            values = json_loads(row_json)
+            resumed[siren] = tuple(values.get(name) for name in CANDIDATE_COLUMNS)
+        print(f"Resuming: {len(resumed)} SIREN already processed in {DEFAULT_RESUME_DB}")
+        if stale:
+            print(f"   {stale} SIREN recorded with other options (web scan, search engines…) will be processed again")
+        candidates = [(siren, e) for siren, e in candidates if siren not in resumed]
+
+    # Batch SIREN enrichment up front instead of one blocking call per candidate
+    enterprises: Dict[str, Optional[dict]] = {}
+    if not args.no_web_scan:
+        print(f"Fetching enterprise records for {len(candidates)} SIREN…")
+        enterprises = prefetch_enterprises([siren for siren, _ in candidates], args.sleep)
+
+    # Only the flat CSV rows are kept (no DataFrame), with their candidate position;
+    # they are sorted once at the end
+    ranked: List[Tuple[int, Tuple[Any, ...]]] = [(candidate_pos[siren], row) for siren, row in resumed.items()]
+    naf_prefixes = tuple(naf_codes)  # built once for all candidates
+    # Build the keyword scanners (one automaton / alternation per list) before the workers start,
+    # instead of letting concurrent first calls each compile their own copy
+    _keyword_matcher(tuple(NAME_KEYWORDS))
+    _keyword_matcher(PAGE_KEYWORDS)
+    total = len(candidates)
+    # Candidates are independent and network-bound: process them on a pool of worker threads.
+    # Politeness towards each API is enforced per host by RATE_LIMITER, not by a global sleep.
+    ex = ThreadPoolExecutor(max_workers=max(1, args.workers), thread_name_prefix="candidate")
+    interrupted = False
+    try:
+        futures = {
+            ex.submit(
+                process_candidate,
                 e,
-                naf_codes,
+                naf_prefixes,
                 args.min_emp,
                 args.max_emp,
-                args.sleep,
+                enterprise=enterprises.get(siren),
                 web_scan=not args.no_web_scan,
                 use_serpapi=args.use_serpapi,
                 serpapi_key=args.serpapi_key,
@@ -1197,32 +1872,54 @@ def main() -> None:
                 serpapi_hl=args.serpapi_hl,
                 serpapi_gl=args.serpapi_gl,
                 use_serper=args.use_serper,
+            ): (candidate_pos[siren], siren, e)
+            for siren, e in candidates
+        }
+        for i, fut in enumerate(as_completed(futures), start=1):
+            pos, siren, e = futures[fut]
+            display_name = (
+                (e.get("unite_legale", {}) or {}).get("denomination")
+                or e.get("nom_raison_sociale")
+                or ""
             )
-            processed.append(row)
-        except Exception as exc:
-            print("Error processing", siren, exc)
-        time.sleep(args.sleep)
+            try:
+                row = fut.result()
+            except Exception as exc:
+                log("Error processing", siren, exc)
+                continue
+            log(f"[{i}/{total}] Processed SIREN {siren} - {display_name[:40]}")
+            ranked.append((pos, candidate_row(row)))
+            if resume_db is not None:
+                resume_db.execute(
+                    "INSERT OR REPLACE INTO processed (siren, row, ts, opts) VALUES (?, ?, ?, ?)",
+                    (siren, json_dumps(dict(zip(CANDIDATE_COLUMNS, ranked[-1][1]))), int(time.time()), run_opts),
+                )
+                if i % RESUME_COMMIT_EVERY == 0:
+                    resume_db.commit()
+    except KeyboardInterrupt:
+        # Drop the queued candidates instead of letting shutdown(wait=True) run them all,
+        # then save what was collected before re-raising
+        interrupted = True
+        log("Interrupted: cancelling pending candidates and saving the rows collected so far…")
+        ex.shutdown(wait=False, cancel_futures=True)
+    else:
+        ex.shutdown()
+    if resume_db is not None:
+        resume_db.commit()
+        resume_db.close()
 
     # Export CSV
-    rows: List[Dict[str, Any]] = []
-    for pc in processed:
-        d = asdict(pc)
-        # stringify signals for CSV readability
-        d["signals"] = json.dumps(d["signals"], ensure_ascii=False)
-        rows.append(d)
-
-    df = pd.DataFrame(rows)
-    if not df.empty:
-        df = df.sort_values("score", ascending=False)
+    # Highest score first; completion order varies between runs, so ties follow the candidate order
+    ranked.sort(key=lambda pr: (-_score_of(pr[1]), pr[0]))
+    rows = [row for _, row in ranked]
     out_path = Path(args.outfile)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(out_path, index=False)
+    write_csv(rows, out_path)
 
     # Also write filtered relevant file as requested
     try:
-        df_filtered = df[df["pertinent_for_clustor"] == True] if not df.empty else df
         filtered_path = out_path.parent / "esn_relevant_for_clustor.csv"
-        df_filtered.to_csv(filtered_path, index=False)
+        write_csv([r for r in rows if _is_pertinent(r)], filtered_path)
         print("Done. Saved to", out_path)
         print("Relevant subset saved to", filtered_path)
     except Exception as ex:
@@ -1230,6 +1927,8 @@ def main() -> None:
     
     # Print Serper API usage summary
     print_serper_usage_summary()
+    if interrupted:
+        raise KeyboardInterrupt
 
 
 if __name__ == "__main__":
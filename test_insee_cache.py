@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+test_insee_cache.py
+Test de non-régression : une page INSEE /siret relue depuis le cache --cache
+doit donner les mêmes établissements que la première lecture réseau.
+"""
+
+import gzip
+import http.server
+import json
+import os
+import sys
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.dirname(__file__))
+import build_esn_list  # noqa: E402
+
+PAGE = {
+    "etablissements": [
+        {
+            "siren": "123456789",
+            "etablissementSiege": True,
+            "uniteLegale": {
+                "denominationUniteLegale": "ACME CONSEIL",
+                "activitePrincipaleUniteLegale": "62.02A",
+                "trancheEffectifsUniteLegale": "12",
+            },
+        }
+    ]
+}
+
+
+class _SiretHandler(http.server.BaseHTTPRequestHandler):
+    hits = 0
+
+    def do_GET(self):
+        type(self).hits += 1
+        body = gzip.compress(json.dumps(PAGE).encode("utf-8"))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_stream_insee_page_from_cache():
+    """Deux lectures de la même page via CachedSession : la seconde vient du cache"""
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _SiretHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    previous_session, previous_base = build_esn_list.SESSION, build_esn_list.INSEE_SIRENE_BASE
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            # The INSEE base is one of the cached hosts
+            build_esn_list.INSEE_SIRENE_BASE = base
+            build_esn_list.SESSION = build_esn_list.build_session(cache_path=os.path.join(tmp, "cache.sqlite"))
+            params = {"q": "activitePrincipaleUniteLegale:62.02A", "nombre": 1, "debut": 0}
+            first = build_esn_list.stream_insee_page(f"{base}/siret", {}, params)
+            second = build_esn_list.stream_insee_page(f"{base}/siret", {}, params)
+        finally:
+            build_esn_list.SESSION.close()
+            build_esn_list.SESSION, build_esn_list.INSEE_SIRENE_BASE = previous_session, previous_base
+            server.shutdown()
+    assert _SiretHandler.hits == 1
+    assert first and first == second
+    assert second[0]["siren"] == "123456789"
+
+
+if __name__ == "__main__":
+    test_stream_insee_page_from_cache()
+    print("✓ PASS: page INSEE relue depuis le cache")
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+test_rate_limiter.py
+Test de non-régression : une requête partie vers un hôte avant sa déclaration
+(ex. le POST /token d'INSEE) ne doit pas désactiver l'espacement déclaré ensuite.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+import build_esn_list  # noqa: E402
+
+
+def test_interval_declared_after_first_request():
+    """acquire() sur un hôte non déclaré ne fige pas un intervalle nul"""
+    limiter = build_esn_list.HostRateLimiter()
+    limiter.acquire("https://api.insee.fr/token")
+    limiter.set_interval("https://api.insee.fr/entreprises/sirene/V3.11/siret", 0.3)
+    start = time.monotonic()
+    limiter.acquire("https://api.insee.fr/entreprises/sirene/V3.11/siret")
+    limiter.acquire("https://api.insee.fr/entreprises/sirene/V3.11/siret")
+    assert time.monotonic() - start >= 0.25
+
+
+if __name__ == "__main__":
+    test_interval_declared_after_first_request()
+    print("✓ PASS: espacement INSEE conservé après le token")